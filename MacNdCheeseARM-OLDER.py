@@ -1,26 +1,26 @@
 
 from __future__ import annotations
 
+import codecs
 import json
 import os
 import re
 import shlex
 import shutil
-import ssl
 import subprocess
 import sys
 import time
-import urllib.request
-import webbrowser
 import platform
 import getpass
 import signal
 import stat
 import tempfile
 import contextlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional, Any
+from typing import Iterable, Iterator, Optional, Any
 
 
 from PyQt6.QtGui import QAction, QPixmap, QPainter, QIcon, QColor
@@ -607,6 +607,12 @@ class SettingsDialog(QDialog):
         self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
         layout.addWidget(self.log_view)
+
+        self._log_pending: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
         return widget
 
     def _browsable(self, field: QLineEdit, *, dir: bool) -> QWidget:
@@ -706,7 +712,15 @@ class SettingsDialog(QDialog):
                 parent._update_topbar_button()
 
     def log(self, message: str) -> None:
-        self.log_view.appendPlainText(message)
+        self._log_pending.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if self._log_pending:
+            block = "\n".join(self._log_pending)
+            self._log_pending.clear()
+            self.log_view.appendPlainText(block)
 
 
 class _AdminPasswordDialog(QDialog):
@@ -1167,11 +1181,21 @@ DEFAULT_PATCHED_WINE_APP_RESOURCES_SUBDIR = "wine-build"
 STEAM_URL = "https://steamcdn-a.akamaihd.net/client/installer/SteamSetup.exe"
 DXVK_DLLS = ("d3d11.dll", "d3d10core.dll")
 DXVK_OPTIONAL_DLLS = ("dxgi.dll",)
+# Crash reporters, installers, uninstallers and launcher helpers that sit next
+# to the real game EXE.
+BAD_EXE_RE = re.compile(
+    r"crash|reporter|setup|install|unins|helper|bootstrap|diagnostics",
+    re.IGNORECASE,
+)
+# Characters that may not appear in the per-game log file names.
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
 GPTK_REQUIRED_DLLS = ("dxgi.dll", "d3d11.dll", "d3d12.dll")
 GPTK_OPTIONAL_DLLS = ("d3d12core.dll", "d3d10core.dll")
 
 DEFAULT_MESA_URL = "https://github.com/pal1000/mesa-dist-win/releases/download/23.1.9/mesa3d-23.1.9-release-msvc.7z"
 
+_BASE_ENV = dict(os.environ)
+
 
 LAUNCH_BACKEND_AUTO = "auto"
 LAUNCH_BACKEND_WINE = "wine"
@@ -1730,6 +1754,116 @@ class BackendRegistry:
         return self._backends.values()
 
 
+def _walk_dirs(root: Path, max_depth: Optional[int] = None) -> Iterator[tuple[str, int, list[os.DirEntry]]]:
+    """Yield ``(dir, depth, entries)`` for ``root`` and each dir below it, in ``glob("**")`` order."""
+    pending: list[tuple[str, int]] = [(str(root), 0)]
+    while pending:
+        current, depth = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        yield current, depth, entries
+        if max_depth is not None and depth >= max_depth:
+            continue
+        subdirs: list[tuple[str, int]] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, depth + 1))
+            except OSError:
+                continue
+        pending.extend(reversed(subdirs))
+
+
+def _is_file_named(entry: os.DirEntry, suffix: str) -> bool:
+    try:
+        return entry.name.endswith(suffix) and entry.is_file()
+    except OSError:
+        return False
+
+
+def _scan_exe_tree(root: Path) -> list[tuple[int, int, Path]]:
+    """Return ``(depth, size, path)`` for every .exe below ``root``, in ``glob("**/*.exe")`` order."""
+    found: list[tuple[int, int, Path]] = []
+    for _, depth, entries in _walk_dirs(root):
+        for entry in entries:
+            if _is_file_named(entry, ".exe"):
+                try:
+                    found.append((depth, entry.stat().st_size, Path(entry.path)))
+                except OSError:
+                    continue
+    return found
+
+
+def _find_patch_dirs(root: Path) -> set[Path]:
+    """Return every ``Binaries/Win64`` dir and every dir holding a ``*-Shipping.exe`` below ``root``."""
+    found: set[Path] = set()
+    for current, depth, entries in _walk_dirs(root):
+        if depth >= 2 and os.path.basename(current) == "Win64" and os.path.basename(os.path.dirname(current)) == "Binaries":
+            found.add(Path(current))
+        if any(_is_file_named(entry, "-Shipping.exe") for entry in entries):
+            found.add(Path(current))
+    return found
+
+
+def _sample_exes(root: Path, limit: int = 20, max_depth: int = 2) -> list[str]:
+    """Return up to ``limit`` .exe paths at most ``max_depth`` dirs below ``root``, relative to it."""
+    found: list[tuple[int, str]] = []
+    base = str(root)
+    for _, depth, entries in _walk_dirs(root, max_depth):
+        for entry in entries:
+            if entry.name.endswith(".exe"):
+                found.append((depth, os.path.relpath(entry.path, base)))
+        if len(found) >= limit:
+            break
+    return [rel for _, rel in sorted(found)[:limit]]
+
+
+def _tail_file(path: Path, n: int = 200, block: int = 64 * 1024) -> list[str]:
+    """Return the last ``n`` lines of ``path``, reading backwards from the end."""
+    chunks: deque[bytes] = deque()
+    newlines = 0
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= n:
+            read = min(block, pos)
+            pos -= read
+            f.seek(pos)
+            chunk = f.read(read)
+            newlines += chunk.count(b"\n")
+            chunks.appendleft(chunk)
+    lines = b"".join(chunks).splitlines()
+    if pos > 0:
+        # The first line of what we read is almost always cut off.
+        lines = lines[1:]
+    return [line.decode("utf-8", "ignore") for line in lines[-n:]]
+
+
+class _LineDecoder:
+    """Incrementally decode a UTF-8 byte stream into complete lines."""
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._partial = ""
+
+    def feed(self, data: bytes, final: bool = False) -> list[str]:
+        text = self._partial + self._decoder.decode(data, final)
+        if final:
+            self._partial = ""
+            return text.splitlines()
+        # Break on \r as well as \n so progress output isn't held back, but
+        # keep a trailing \r: it may be the first half of a \r\n.
+        end = len(text) - 1 if text.endswith("\r") else len(text)
+        cut = max(text.rfind("\n", 0, end), text.rfind("\r", 0, end))
+        if cut < 0:
+            self._partial = text
+            return []
+        self._partial = text[cut + 1:]
+        return text[:cut + 1].splitlines()
+
+
 @dataclass
 class GameEntry:
     appid: str
@@ -1738,6 +1872,9 @@ class GameEntry:
     library_root: Path
     custom_exe: Optional[Path] = None  # set for manually-added library entries
     cover_path: Optional[Path] = None  # custom cover image for manual entries
+    # detect_exe() memo, keyed by the game dir's mtime.
+    _exe_cache: Optional[Path] = field(default=None, init=False, compare=False, repr=False)
+    _exe_mtime: Optional[int] = field(default=None, init=False, compare=False, repr=False)
 
     @property
     def game_dir(self) -> Path:
@@ -1745,22 +1882,42 @@ class GameEntry:
             return self.custom_exe.parent
         return self.library_root / "steamapps" / "common" / self.install_dir_name
 
+    @staticmethod
+    def _is_probably_not_game(exe: Path) -> bool:
+        return BAD_EXE_RE.search(exe.name) is not None
+
+    def invalidate_exe_cache(self) -> None:
+        self._exe_cache = None
+        self._exe_mtime = None
+
     def detect_exe(self) -> Optional[Path]:
         if self.custom_exe is not None:
             return self.custom_exe if self.custom_exe.exists() else None
-        if not self.game_dir.exists():
+        try:
+            mtime = os.stat(self.game_dir).st_mtime_ns
+        except OSError:
+            self.invalidate_exe_cache()
             return None
+        cached = self._exe_cache
+        if cached is not None and self._exe_mtime == mtime and cached.exists():
+            return cached
 
-        try:
-            shipping = sorted(
-                self.game_dir.glob("**/*-Shipping.exe"),
-                key=lambda p: p.stat().st_size if p.exists() else 0,
-                reverse=True,
-            )
-            if shipping:
-                return shipping[0]
-        except Exception:
-            pass
+        exe = self._detect_exe_uncached()
+        self._exe_cache = exe
+        self._exe_mtime = mtime if exe is not None else None
+        return exe
+
+    def _detect_exe_uncached(self) -> Optional[Path]:
+        found = _scan_exe_tree(self.game_dir)
+
+        best_shipping: Optional[tuple[int, Path]] = None
+        for _, size, exe in found:
+            if exe.name.endswith("-Shipping.exe") and (best_shipping is None or size > best_shipping[0]):
+                best_shipping = (size, exe)
+        if best_shipping is not None:
+            return best_shipping[1]
+
+        walked = {exe for _, _, exe in found}
 
         candidates: list[Path] = []
         for name in (
@@ -1770,44 +1927,23 @@ class GameEntry:
             f"{self.install_dir_name.replace(' ', '')}.exe",
         ):
             p = self.game_dir / name
-            if p.exists():
+            if p in walked or p.exists():
                 candidates.append(p)
 
-        def _is_probably_not_game(exe: Path) -> bool:
-            lowered = exe.name.lower()
-            bad_tokens = (
-                "crash",
-                "reporter",
-                "setup",
-                "install",
-                "unins",
-                "unitycrash",
-                "helper",
-                "bootstrap",
-                "diagnostics",
-                "dxwebsetup",
-            )
-            return any(t in lowered for t in bad_tokens)
-
-        root_exes = sorted(self.game_dir.glob("*.exe"), key=lambda p: p.stat().st_size, reverse=True)
-        candidates.extend([p for p in root_exes if not _is_probably_not_game(p)])
-
-        sub_exes: list[Path] = []
-        patterns = [
-            "**/*.exe",
-        ]
-        for pat in patterns:
-            for exe in self.game_dir.glob(pat):
-                if exe.is_file() and not _is_probably_not_game(exe):
-                    sub_exes.append(exe)
-
-        shipping = [p for p in sub_exes if "shipping.exe" in p.name.lower()]
-        shipping.sort(key=lambda p: p.stat().st_size if p.exists() else 0, reverse=True)
-        if shipping:
-            candidates.extend(shipping)
+        # Root EXEs first, then anything named *shipping.exe further down, then
+        # the rest of the tree -- each group largest first.
+        def _rank(item: tuple[int, int, Path]) -> tuple[int, int]:
+            depth, size, exe = item
+            if depth == 0:
+                group = 0
+            elif "shipping.exe" in exe.name.lower():
+                group = 1
+            else:
+                group = 2
+            return group, -size
 
-        sub_exes.sort(key=lambda p: p.stat().st_size, reverse=True)
-        candidates.extend(sub_exes)
+        ranked = sorted((item for item in found if not self._is_probably_not_game(item[2])), key=_rank)
+        candidates.extend(exe for _, _, exe in ranked)
 
         low_name = self.name.lower()
         low_install = self.install_dir_name.lower()
@@ -1817,14 +1953,19 @@ class GameEntry:
                 if "shipping.exe" in lowered and "win64" in str(exe).lower():
                     return exe
 
+        seen: set[Path] = set()
         for exe in candidates:
+            if exe in seen:
+                continue
+            seen.add(exe)
+            if exe in walked:
+                return exe
             try:
-                if exe.exists() and exe.is_file():
+                if exe.is_file():
                     return exe
             except Exception:
                 continue
 
-       
         if candidates:
             return candidates[0]
 
@@ -1854,25 +1995,18 @@ class GameEntry:
         if not self.game_dir.exists():
             return []
 
-        def _is_probably_not_game(exe: Path) -> bool:
-            lowered = exe.name.lower()
-            bad_tokens = (
-                "crash",
-                "reporter",
-                "setup",
-                "install",
-                "unins",
-                "unitycrash",
-                "helper",
-                "bootstrap",
-                "diagnostics",
-            )
-            return any(t in lowered for t in bad_tokens)
-            return any(t in lowered for t in bad_tokens)
+        found = _scan_exe_tree(self.game_dir)
+        size_of = {exe: size for _, size, exe in found}
+        by_size = sorted(found, key=lambda item: item[1], reverse=True)
 
         seen: set[str] = set()
         candidates: list[Path] = []
 
+        def _add(exe: Path) -> None:
+            if str(exe) not in seen:
+                seen.add(str(exe))
+                candidates.append(exe)
+
         preferred_names = (
             "Project Playtime.exe",
             "Launch.exe",
@@ -1880,23 +2014,13 @@ class GameEntry:
             "Start.exe",
         )
         for name in preferred_names:
-            for exe in self.game_dir.glob(f"**/{name}"):
-                if exe.is_file() and str(exe) not in seen:
-                    seen.add(str(exe))
-                    candidates.append(exe)
+            for _, _, exe in found:
+                if exe.name == name:
+                    _add(exe)
 
-        try:
-            shipping = sorted(
-                self.game_dir.glob("**/*-Shipping.exe"),
-                key=lambda p: p.stat().st_size if p.exists() else 0,
-                reverse=True,
-            )
-            for exe in shipping:
-                if str(exe) not in seen:
-                    seen.add(str(exe))
-                    candidates.append(exe)
-        except Exception:
-            pass
+        for _, _, exe in by_size:
+            if exe.name.endswith("-Shipping.exe"):
+                _add(exe)
 
         for name in (
             f"{self.install_dir_name}.exe",
@@ -1905,40 +2029,16 @@ class GameEntry:
             f"{self.install_dir_name.replace(' ', '')}.exe",
         ):
             p = self.game_dir / name
-            if p.exists() and p.is_file() and not _is_probably_not_game(p) and str(p) not in seen:
-                seen.add(str(p))
-                candidates.append(p)
-
-        try:
-            root_exes = sorted(self.game_dir.glob("*.exe"), key=lambda p: p.stat().st_size, reverse=True)
-            for p in root_exes:
-                if not _is_probably_not_game(p) and str(p) not in seen:
-                    seen.add(str(p))
-                    candidates.append(p)
-        except Exception:
-            pass
+            if (p in size_of or p.is_file()) and not self._is_probably_not_game(p):
+                _add(p)
 
-        patterns = [
-            "**/*.exe",
-        ]
-        sub_exes: list[Path] = []
-        for pat in patterns:
-            try:
-                for exe in self.game_dir.glob(pat):
-                    if exe.is_file() and not _is_probably_not_game(exe):
-                        sub_exes.append(exe)
-            except Exception:
-                pass
+        for depth, _, exe in by_size:
+            if depth == 0 and not self._is_probably_not_game(exe):
+                _add(exe)
 
-        try:
-            sub_exes.sort(key=lambda p: p.stat().st_size, reverse=True)
-        except Exception:
-            pass
-
-        for exe in sub_exes:
-            if str(exe) not in seen:
-                seen.add(str(exe))
-                candidates.append(exe)
+        for _, _, exe in by_size:
+            if not self._is_probably_not_game(exe):
+                _add(exe)
 
         low_name = self.name.lower()
         low_install = self.install_dir_name.lower()
@@ -1947,65 +2047,125 @@ class GameEntry:
                 key=lambda p: (
                     0 if ("shipping.exe" in p.name.lower() and "win64" in str(p).lower()) else 1,
                     0 if "shipping.exe" in p.name.lower() else 1,
-                    -p.stat().st_size if p.exists() else 0,
+                    -size_of.get(p, 0),
                 )
             )
 
         return candidates
 
 
-class CommandWorker(QObject):
+class CommandRunner(QObject):
+    """Runs a list of commands one after another on the GUI event loop via QProcess."""
+
     output = pyqtSignal(str)
     error = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, commands: list[list[str]], env: dict[str, str] | None = None, cwd: str | None = None):
-        super().__init__()
+    def __init__(
+        self,
+        commands: list[list[str]],
+        env: dict[str, str] | None = None,
+        cwd: str | None = None,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
         self.commands = commands
-        self.env = env or os.environ.copy()
+        self.env = env
         self.cwd = cwd
-        self._proc: Optional[subprocess.Popen] = None
+        self._queue: deque[list[str]] = deque(commands)
+        self._current: list[str] = []
+        self._buf = bytearray()
         self._cancelled = False
+        self._done = False
+
+        self._proc = QProcess(self)
+        self._proc.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        # Commands that read stdin get EOF instead of waiting on an open pipe.
+        self._proc.setStandardInputFile(QProcess.nullDevice())
+        if env is not None:
+            qenv = QProcessEnvironment()
+            for key, value in env.items():
+                qenv.insert(key, value)
+            self._proc.setProcessEnvironment(qenv)
+        if cwd:
+            self._proc.setWorkingDirectory(cwd)
+        # Each command gets its own session so cancel() can signal its whole
+        # process group. Needs Qt 6.7.
+        self._proc.setUnixProcessParameters(QProcess.UnixProcessFlag.CreateNewSession)
+        self._proc.readyReadStandardOutput.connect(self._drain)
+        self._proc.finished.connect(self._on_process_finished)
+        self._proc.errorOccurred.connect(self._on_process_error)
+
+    def start(self) -> None:
+        self._start_next()
 
     def cancel(self) -> None:
         self._cancelled = True
-        if self._proc and hasattr(self._proc, 'pid') and self._proc.pid and self._proc.poll() is None:
-            try:
-                os.killpg(os.getpgid(self._proc.pid), signal.SIGTERM)
-            except Exception:
-                self._proc.terminate()
-
-    def run(self) -> None:
+        if self._proc.state() == QProcess.ProcessState.NotRunning:
+            return
         try:
-            for cmd in self.commands:
-                if self._cancelled:
-                    self.finished.emit(False, 'Cancelled')
-                    return
-                self.output.emit(f"$ {' '.join(cmd)}")
-                self._proc = subprocess.Popen(
-                    cmd, 
-                    cwd=self.cwd, 
-                    env=self.env, 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.STDOUT, 
-                    text=True, 
-                    bufsize=1,
-                    start_new_session=True
-                )
-                assert self._proc.stdout is not None
-                for line in self._proc.stdout:
-                    self.output.emit(line.rstrip())
-                rc = self._proc.wait()
-                if self._cancelled:
-                    self.finished.emit(False, 'Cancelled')
-                    return
-                if rc != 0:
-                    self.finished.emit(False, f"Command failed with exit code {rc}: {' '.join(cmd)}")
-                    return
-            self.finished.emit(True, 'Done')
-        except Exception as exc:
-            self.error.emit(str(exc))
-            self.finished.emit(False, str(exc))
+            pgid = os.getpgid(self._proc.processId())
+            if pgid != os.getpgrp():
+                os.killpg(pgid, signal.SIGTERM)
+                return
+        except Exception:
+            pass
+        self._proc.terminate()
+
+    def _start_next(self) -> None:
+        if self._cancelled:
+            self._finish(False, 'Cancelled')
+            return
+        if not self._queue:
+            self._finish(True, 'Done')
+            return
+        cmd = self._queue.popleft()
+        self._current = cmd
+        self.output.emit(f"$ {' '.join(cmd)}")
+        # Resolve the program on the child env's PATH, not ours.
+        search_path = self.env.get("PATH") if self.env is not None else None
+        program = shutil.which(cmd[0], path=search_path) or cmd[0]
+        self._proc.start(program, cmd[1:])
+
+    def _finish(self, ok: bool, message: str) -> None:
+        if not self._done:
+            self._done = True
+            self.finished.emit(ok, message)
+
+    def _drain(self) -> None:
+        self._buf += bytes(self._proc.readAllStandardOutput())
+        # A trailing \r may be the first half of a \r\n split across reads.
+        end = len(self._buf) - 1 if self._buf.endswith(b"\r") else len(self._buf)
+        cut = max(self._buf.rfind(b"\n", 0, end), self._buf.rfind(b"\r", 0, end))
+        if cut < 0:
+            return
+        self._emit_lines(self._buf[:cut + 1])
+        del self._buf[:cut + 1]
+
+    def _emit_lines(self, data: bytearray) -> None:
+        lines = data.decode("utf-8", errors="ignore").splitlines()
+        self.output.emit("\n".join(line.rstrip() for line in lines))
+
+    def _on_process_finished(self, code: int, status: QProcess.ExitStatus) -> None:
+        self._drain()
+        if self._buf:
+            self._emit_lines(self._buf)
+            self._buf.clear()
+        if self._cancelled:
+            self._finish(False, 'Cancelled')
+        elif status == QProcess.ExitStatus.CrashExit:
+            self._finish(False, f"Command crashed: {' '.join(self._current)}")
+        elif code != 0:
+            self._finish(False, f"Command failed with exit code {code}: {' '.join(self._current)}")
+        else:
+            self._start_next()
+
+    def _on_process_error(self, err: QProcess.ProcessError) -> None:
+        # Crashes also land in finished(); only a failed start ends here alone.
+        if err == QProcess.ProcessError.FailedToStart:
+            message = f"{self._proc.errorString()}: {' '.join(self._current)}"
+            self.error.emit(message)
+            self._finish(False, message)
 
 
 class LibraryScannerWorker(QThread):
@@ -2057,6 +2217,9 @@ class CoverFetcher(QThread):
             except Exception:
                 pass
 
+        import ssl
+        import urllib.request
+
         cdn_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{self.appid}/library_600x900.jpg"
         try:
             ctx = ssl.create_default_context()
@@ -2072,79 +2235,159 @@ class CoverFetcher(QThread):
             pass
 
 
+_BACKSLASH_TO_SLASH = str.maketrans('\\', '/')
+
+
 class SteamScanner:
-    APPMANIFEST_RE = re.compile(r'"(?P<key>[^"]+)"\s+"(?P<value>[^"]*)"')
+    MANIFEST_KEYS_RE = re.compile(rb'"(appid|name|installdir)"\s+"([^"]*)"')
+    PARALLEL_PARSE_MIN = 8
+    # appmanifest path -> (st_mtime_ns, st_size, parsed entry or None)
+    _manifest_cache: dict[str, tuple[int, int, Optional[GameEntry]]] = {}
+    # (prefix, libraryfolders.vdf) -> (st_mtime_ns, st_size, converted library paths)
+    _roots_cache: dict[tuple[Path, str], tuple[int, int, list[str]]] = {}
 
     @staticmethod
     def windows_path_to_unix(prefix: Path, value: str) -> Path:
-        normalized = value.replace('\\\\', '\\')
-        if re.match(r'^[A-Za-z]:\\', normalized):
+        normalized = value.replace('\\\\', '\\') if '\\\\' in value else value
+        if len(normalized) >= 3 and normalized[1] == ':' and normalized[2] == '\\' and normalized[0].isascii() and normalized[0].isalpha():
             drive = normalized[0].lower()
-            remainder = normalized[3:].replace('\\', '/')
-            base = prefix / f"drive_{drive}"
-            if drive == 'c':
-                base = prefix / 'drive_c'
-            return base / remainder
-        return Path(normalized.replace('\\', '/'))
+            return prefix / f"drive_{drive}" / normalized[3:].translate(_BACKSLASH_TO_SLASH)
+        return Path(normalized.translate(_BACKSLASH_TO_SLASH))
+
+    @staticmethod
+    def vdf_values(data: bytes, key: bytes) -> Iterator[str]:
+        """Yield the value of every ``"key" "value"`` pair for ``key`` in raw VDF bytes."""
+        token = b'"' + key + b'"'
+        pos = data.find(token)
+        while pos != -1:
+            after = pos + len(token)
+            start = data.find(b'"', after)
+            if start == -1:
+                return
+            end = data.find(b'"', start + 1)
+            if end == -1:
+                return
+            # "key" { ... } opens a section rather than holding a value.
+            if start > after and not data[after:start].strip():
+                yield data[start + 1:end].decode("utf-8", "ignore")
+                pos = data.find(token, end + 1)
+            else:
+                pos = data.find(token, after)
 
     @classmethod
-    def parse_appmanifest(cls, path: Path) -> Optional[GameEntry]:
+    def parse_appmanifest(cls, path: Path | str) -> Optional[GameEntry]:
         try:
-            content = path.read_text(encoding="utf-8", errors="ignore")
+            with open(path, "rb") as f:
+                content = f.read()
         except Exception:
             return None
 
-        data: dict[str, str] = {}
-        for match in cls.APPMANIFEST_RE.finditer(content):
-            key = match.group("key")
-            value = match.group("value")
-            if key in {"appid", "name", "installdir"}:
-                data[key] = value
-
-        if not all(k in data for k in ("appid", "name", "installdir")):
+        data: dict[bytes, str] = {}
+        for match in cls.MANIFEST_KEYS_RE.finditer(content):
+            key = match.group(1)
+            if key not in data:
+                data[key] = match.group(2).decode("utf-8", "ignore")
+                if len(data) == 3:
+                    break
+        if len(data) < 3:
             return None
 
-        library_root = path.parent.parent
+        library_root = Path(os.path.dirname(os.path.dirname(path)))
         return GameEntry(
-            appid=data["appid"],
-            name=data["name"],
-            install_dir_name=data["installdir"],
+            appid=data[b"appid"],
+            name=data[b"name"],
+            install_dir_name=data[b"installdir"],
             library_root=library_root,
         )
 
     @classmethod
     def library_roots(cls, prefix: Path, steam_dir: Path) -> list[Path]:
-        roots: list[Path] = []
-        if steam_dir.exists():
-            roots.append(steam_dir)
-
-        library_vdf = steam_dir / "steamapps" / "libraryfolders.vdf"
-        if not library_vdf.exists():
-            return roots
+        steam_str = str(steam_dir)
+        roots: list[str] = []
+        if os.path.exists(steam_str):
+            roots.append(steam_str)
 
+        library_vdf = os.path.join(steam_str, "steamapps", "libraryfolders.vdf")
         try:
-            content = library_vdf.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            return roots
+            st = os.stat(library_vdf)
+        except OSError:
+            return [Path(r) for r in roots]
+
+        # Only the parsed paths are cached; existence is rechecked every time
+        # so a library on a drive that gets mounted later still shows up.
+        cache_key = (prefix, library_vdf)
+        cached = cls._roots_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            library_paths = cached[2]
+        else:
+            try:
+                with open(library_vdf, "rb") as f:
+                    content = f.read()
+            except Exception:
+                return [Path(r) for r in roots]
+            library_paths = [str(cls.windows_path_to_unix(prefix, value)) for value in cls.vdf_values(content, b"path")]
+            cls._roots_cache[cache_key] = (st.st_mtime_ns, st.st_size, library_paths)
 
-        for key, value in cls.APPMANIFEST_RE.findall(content):
-            if key == "path":
-                converted = cls.windows_path_to_unix(prefix, value)
-                if converted.exists() and converted not in roots:
-                    roots.append(converted)
-        return roots
+        for converted in library_paths:
+            if converted not in roots and os.path.exists(converted):
+                roots.append(converted)
+        return [Path(r) for r in roots]
 
     @classmethod
     def scan_games(cls, prefix: Path, steam_dir: Path) -> list[GameEntry]:
-        games: list[GameEntry] = []
+        manifests: list[tuple[str, int, int]] = []
+        scanned_dirs: set[str] = set()
         for root in cls.library_roots(prefix, steam_dir):
-            steamapps = root / "steamapps"
-            if not steamapps.exists():
+            steamapps = str(root / "steamapps")
+            root_manifests: list[tuple[str, int, int]] = []
+            try:
+                with os.scandir(steamapps) as it:
+                    for e in it:
+                        if not (e.name.startswith("appmanifest_") and e.name.endswith(".acf")):
+                            continue
+                        try:
+                            st = e.stat()
+                        except OSError:
+                            continue
+                        root_manifests.append((e.path, st.st_mtime_ns, st.st_size))
+            except OSError:
                 continue
-            for manifest in sorted(steamapps.glob("appmanifest_*.acf")):
-                entry = cls.parse_appmanifest(manifest)
-                if entry and entry.appid != "228980":
-                    games.append(entry)
+            scanned_dirs.add(steamapps)
+            root_manifests.sort()
+            manifests.extend(root_manifests)
+
+        cache = cls._manifest_cache
+        stale: list[str] = []
+        for path, mtime_ns, size in manifests:
+            cached = cache.get(path)
+            if cached is None or cached[0] != mtime_ns or cached[1] != size:
+                stale.append(path)
+
+        parsed: dict[str, Optional[GameEntry]] = {}
+        if len(stale) >= cls.PARALLEL_PARSE_MIN:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parsed = dict(zip(stale, pool.map(cls.parse_appmanifest, stale)))
+        else:
+            parsed = {path: cls.parse_appmanifest(path) for path in stale}
+
+        games: list[GameEntry] = []
+        current: set[str] = set()
+        for path, mtime_ns, size in manifests:
+            current.add(path)
+            if path in parsed:
+                entry = parsed[path]
+                cache[path] = (mtime_ns, size, entry)
+            else:
+                entry = cache[path][2]
+            if entry and entry.appid != "228980":
+                games.append(entry)
+
+        # Forget manifests that were uninstalled from the libraries just scanned.
+        for path in list(cache):
+            if path not in current and os.path.dirname(path) in scanned_dirs:
+                cache.pop(path, None)
+
         games.sort(key=lambda g: g.name.lower())
         return games
 
@@ -2665,6 +2908,9 @@ class UpdateChecker(QThread):
         super().__init__(parent)
 
     def run(self):
+        import ssl
+        import urllib.request
+
         try:
             ctx = ssl._create_unverified_context()
             
@@ -2691,8 +2937,7 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(APP_NAME)
         self.resize(1100, 760)
 
-        self.worker_thread: Optional[QThread] = None
-        self.worker: Optional[CommandWorker] = None
+        self.worker: Optional[CommandRunner] = None
         self.steam_process: Optional[QProcess] = None
         self.game_process: Optional[QProcess] = None
         self.games: list[GameEntry] = []
@@ -2721,8 +2966,17 @@ class MainWindow(QMainWindow):
         self._cover_failed: set[str] = set()
         self._active_fetchers: list[CoverFetcher] = []
         self._scanner_worker: Optional[LibraryScannerWorker] = None
+        # Superseded scanners still running; kept alive until their thread ends.
+        self._retired_scanners: set[LibraryScannerWorker] = set()
         self._game_card_cache: dict[str, QWidget] = {}
         self._exe_icon_cache: dict[str, Optional[QPixmap]] = {}
+        # (LocalLow mtimes, company dirs, company mtimes, dirs that may hold a Player.log)
+        self._unity_log_dirs_cache: Optional[tuple[list[tuple[str, int]], list[str], list[tuple[str, int]], list[Path]]] = None
+        # Resolved wine/wineserver paths; dropped after setup tasks that may install Wine.
+        self._wine_binary_cache: Optional[str] = None
+        self._wineserver_binary_cache: Optional[str] = None
+        # id(QProcess) -> (stdout, stderr) decoders used by _drain_process
+        self._drain_decoders: dict[int, tuple[_LineDecoder, _LineDecoder]] = {}
 
         self.component_registry = ComponentRegistry()
         self.backend_registry = BackendRegistry()
@@ -2762,7 +3016,7 @@ class MainWindow(QMainWindow):
         return qenv
 
     def get_app_env_dict(self) -> dict[str, str]:
-        env = os.environ.copy()
+        env = dict(_BASE_ENV)
         path = env.get("PATH", "")
         portable_bin = str(PORTABLE_DIR / "bin")
         if portable_bin not in path:
@@ -2951,6 +3205,10 @@ class MainWindow(QMainWindow):
             self.skip_update_check = True
             self.save_user_settings()
 
+        if msg.clickedButton() == update_btn:
+            import webbrowser
+            webbrowser.open(GITHUB_RELEASES_URL)
+
     def resource_base_dir(self) -> Path:
         if getattr(sys, "frozen", False):
             return Path(sys.executable).resolve().parent.parent / "Resources"
@@ -2995,10 +3253,6 @@ class MainWindow(QMainWindow):
                 continue
         return None
 
-
-        if msg.clickedButton() == update_btn:
-            webbrowser.open(GITHUB_RELEASES_URL)
-
     def _register_components(self) -> None:
         for component in (
             WineComponent(),
@@ -4215,9 +4469,7 @@ class MainWindow(QMainWindow):
 
 
     def wine_env(self) -> dict[str, str]:
-        env = os.environ.copy()
-        env["WINEDEBUG"] = "-all"
-        env["WINEPREFIX"] = str(self.prefix_path)
+        env = {**_BASE_ENV, "WINEDEBUG": "-all", "WINEPREFIX": str(self.prefix_path)}
         
         path = env.get("PATH", "")
         portable_bin = str(PORTABLE_DIR / "bin")
@@ -4267,6 +4519,13 @@ class MainWindow(QMainWindow):
         self.log(message)
 
     def wine_binary(self) -> str:
+        cached = self._wine_binary_cache
+        if cached is not None and os.path.exists(cached):
+            return cached
+        self._wine_binary_cache = self._find_wine_binary()
+        return self._wine_binary_cache
+
+    def _find_wine_binary(self) -> str:
         patched = self.patched_wine_binary()
         if patched:
             return patched
@@ -4295,6 +4554,17 @@ class MainWindow(QMainWindow):
 
 
     def wineserver_binary(self) -> str:
+        cached = self._wineserver_binary_cache
+        if cached is not None and os.path.exists(cached):
+            return cached
+        self._wineserver_binary_cache = self._find_wineserver_binary()
+        return self._wineserver_binary_cache
+
+    def invalidate_wine_binary_cache(self) -> None:
+        self._wine_binary_cache = None
+        self._wineserver_binary_cache = None
+
+    def _find_wineserver_binary(self) -> str:
         patched = self.patched_wineserver_binary()
         if patched:
             return patched
@@ -4322,14 +4592,9 @@ class MainWindow(QMainWindow):
         progress_title: str = "Installing…",
     ) -> None:
 
-        if self.worker_thread is not None:
-            try:
-                if self.worker_thread.isRunning():
-                    QMessageBox.warning(self, APP_NAME, "Another setup task is already running.")
-                    return
-            except RuntimeError:
-                self.worker_thread = None
-                self.worker = None
+        if self.worker is not None:
+            QMessageBox.warning(self, APP_NAME, "Another setup task is already running.")
+            return
 
         self.set_status("Task running")
         self.interactive_install_in_progress = True
@@ -4337,38 +4602,35 @@ class MainWindow(QMainWindow):
         self._progress_dlg = _InstallProgressDialog(progress_title, self)
         self._progress_dlg.cancel_requested.connect(self._cancel_worker)
 
-        self.worker_thread = QThread(self)
         full_env = self.get_app_env_dict()
         if env:
             full_env.update(env)
-        self.worker = CommandWorker(commands, env=full_env, cwd=cwd)
-        self.worker.moveToThread(self.worker_thread)
-
-        self.worker_thread.started.connect(self.worker.run)
+        self.worker = CommandRunner(commands, env=full_env, cwd=cwd, parent=self)
         self.worker.output.connect(self.append_log)
         self.worker.output.connect(self._progress_dlg.update_step)
         self.worker.error.connect(self.append_log)
-        self.worker.finished.connect(self.on_worker_finished)
-
-        self.worker.finished.connect(self.worker_thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker.finished.connect(self._on_runner_finished)
 
-        def _cleanup() -> None:
-            self.worker_thread = None
-            self.worker = None
-
-        self.worker_thread.finished.connect(_cleanup)
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-
-        self.worker_thread.start()
+        # Start from inside the dialog's event loop so even an instant failure
+        # is reported to a dialog that is already showing.
+        QTimer.singleShot(0, self.worker.start)
         self._progress_dlg.exec()
 
+    def _on_runner_finished(self, ok: bool, message: str) -> None:
+        # Drop the runner first: on_worker_finished may chain another run_commands.
+        runner = self.worker
+        self.worker = None
+        if runner is not None:
+            runner.deleteLater()
+        self.on_worker_finished(ok, message)
+
     def _cancel_worker(self) -> None:
         if self.worker:
             self.worker.cancel()
 
     def on_worker_finished(self, ok: bool, message: str) -> None:
         completed_action = self.interactive_install_action
+        self.invalidate_wine_binary_cache()
         self.set_status(message if ok else f"Failed: {message}")
         self.interactive_install_in_progress = False
         if self._progress_dlg is not None:
@@ -4780,6 +5042,10 @@ class MainWindow(QMainWindow):
         return tuple(parts)
 
     def check_for_updates(self) -> None:
+        import ssl
+        import urllib.request
+        import webbrowser
+
         try:
             ctx = ssl._create_unverified_context()
             req = urllib.request.Request(
@@ -5095,6 +5361,7 @@ class MainWindow(QMainWindow):
         
         self.steam_process.readyReadStandardOutput.connect(lambda: self._drain_process(self.steam_process))
         self.steam_process.readyReadStandardError.connect(lambda: self._drain_process(self.steam_process))
+        self.steam_process.finished.connect(lambda code, status: self._drain_process(self.steam_process, final=True))
         self.steam_process.finished.connect(lambda code, status: self.set_status(f"Steam exited with code {code}"))
         self.steam_process.start()
         self.set_status(f"Steam started ({'backend ' + backend.backend_id if backend else 'host wine'})")
@@ -5159,30 +5426,79 @@ class MainWindow(QMainWindow):
         
         self.launch_steam()
 
-    def _drain_process(self, proc: QProcess | None) -> None:
+    def _drain_process(self, proc: QProcess | None, final: bool = False) -> None:
         if not proc:
             return
-        out = bytes(proc.readAllStandardOutput()).decode(errors="ignore")
-        err = bytes(proc.readAllStandardError()).decode(errors="ignore")
-        for chunk in (out, err):
-            if chunk:
-                for line in chunk.splitlines():
-                    self.log(line)
+        # One decoder per channel, kept across reads so a line or UTF-8
+        # sequence split between two readyRead signals comes out whole.
+        decoders = self._drain_decoders.get(id(proc))
+        if decoders is None:
+            decoders = self._drain_decoders[id(proc)] = (_LineDecoder(), _LineDecoder())
+        lines = decoders[0].feed(bytes(proc.readAllStandardOutput()), final)
+        lines += decoders[1].feed(bytes(proc.readAllStandardError()), final)
+        if final:
+            del self._drain_decoders[id(proc)]
+        if lines:
+            self.log("\n".join(lines))
 
     def is_unity_game(self, game: GameEntry) -> bool:
         data_dir = game.game_dir / f"{game.install_dir_name}_Data"
         if data_dir.exists():
             return True
-        if any(p.is_dir() and p.name.lower().endswith("_data") for p in game.game_dir.iterdir() if game.game_dir.exists()):
-            return True
-        return False
+        try:
+            with os.scandir(game.game_dir) as it:
+                return any(e.name.lower().endswith("_data") and e.is_dir() for e in it)
+        except OSError:
+            return False
 
     def _unity_player_log_candidates(self) -> list[Path]:
-        
         base = self.prefix_path / "drive_c" / "users"
-        if not base.exists():
+        try:
+            with os.scandir(base) as it:
+                local_lows = [os.path.join(e.path, "AppData", "LocalLow") for e in it if e.is_dir()]
+        except OSError:
             return []
-        return list(base.glob("*/AppData/LocalLowPlayer.log")) + list(base.glob("*/AppData/LocalLow/*/Player.log"))
+
+        # Unity writes LocalLow/<Company>/<Product>/Player.log. A dir's mtime
+        # moves when a folder is created in it, so each level is only listed
+        # again when its parent's mtime changes.
+        local_low_key = self._dir_mtimes(local_lows)
+        cached = self._unity_log_dirs_cache
+        if cached is not None and cached[0] == local_low_key:
+            companies = cached[1]
+        else:
+            companies = self._list_subdirs(path for path, _ in local_low_key)
+        company_key = self._dir_mtimes(companies)
+
+        if cached is not None and cached[0] == local_low_key and cached[2] == company_key:
+            log_dirs = cached[3]
+        else:
+            log_dirs = [Path(d) for d in companies]
+            log_dirs.extend(Path(d) for d in self._list_subdirs(companies))
+            self._unity_log_dirs_cache = (local_low_key, companies, company_key, log_dirs)
+
+        return [d / "Player.log" for d in log_dirs if (d / "Player.log").is_file()]
+
+    @staticmethod
+    def _dir_mtimes(dirs: Iterable[str]) -> list[tuple[str, int]]:
+        stamped: list[tuple[str, int]] = []
+        for d in dirs:
+            try:
+                stamped.append((d, os.stat(d).st_mtime_ns))
+            except OSError:
+                continue
+        return stamped
+
+    @staticmethod
+    def _list_subdirs(dirs: Iterable[str]) -> list[str]:
+        subdirs: list[str] = []
+        for d in dirs:
+            try:
+                with os.scandir(d) as it:
+                    subdirs.extend(e.path for e in it if e.is_dir())
+            except OSError:
+                continue
+        return subdirs
 
     def latest_unity_player_log_for_game(self, game: GameEntry) -> Optional[Path]:
         candidates = self._unity_player_log_candidates()
@@ -5195,12 +5511,15 @@ class MainWindow(QMainWindow):
         preferred = [p for p in candidates if needle1 in str(p).lower() or needle2 in str(p).lower()]
         pool = preferred if preferred else candidates
 
-        
-        try:
-            pool.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        except Exception:
+        stamped: list[tuple[float, Path]] = []
+        for p in pool:
+            try:
+                stamped.append((p.stat().st_mtime, p))
+            except OSError:
+                continue
+        if not stamped:
             return None
-        return pool[0] if pool else None
+        return max(stamped, key=lambda t: t[0])[1]
 
     def show_unity_player_log_for_selected_game(self) -> None:
         game = self.selected_game()
@@ -5212,51 +5531,54 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, APP_NAME, "No Unity Player.log found in the prefix yet. Launch the game once, then try again.")
             return
         try:
-            text = log_path.read_text(encoding="utf-8", errors="ignore")
+            lines = _tail_file(log_path)
         except Exception as exc:
             QMessageBox.warning(self, APP_NAME, f"Failed to read Player.log: {exc}")
             return
-        lines = text.splitlines()
-        tail = "\n".join(lines[-200:]) if lines else "(log is empty)"
-        self.log(f"--- Unity Player.log: {log_path} (last {min(200, len(lines))} lines) ---")
-        for line in tail.splitlines():
-            self.log(line)
+        tail = "\n".join(lines) if lines else "(log is empty)"
+        self.log(f"--- Unity Player.log: {log_path} (last {len(lines)} lines) ---")
+        self.log(tail)
 
     def _latest_dxvk_log_for_game(self, game: GameEntry) -> Optional[Path]:
         logs_dir = Path.home() / "dxvk-logs"
-        if not logs_dir.exists():
-            return None
-
-        all_logs = list(logs_dir.glob("*_d3d11.log"))
-        if not all_logs:
-            return None
 
-        candidates: list[Path] = []
-        name_clean = game.name.replace(' ', '')
-        install_clean = (game.install_dir_name or "").replace(' ', '')
-        
-        for p in all_logs:
-            fname = p.name
-            if (game.name in fname or name_clean in fname or 
-                (game.install_dir_name and game.install_dir_name in fname) or 
-                (install_clean and install_clean in fname)):
-                candidates.append(p)
+        needles = {
+            game.name,
+            game.name.replace(' ', ''),
+            game.install_dir_name or "",
+            (game.install_dir_name or "").replace(' ', ''),
+        }
+        needles.discard("")
+        name_re = re.compile("|".join(map(re.escape, needles))) if needles else None
 
-        if not candidates:
-            candidates = all_logs
+        all_logs: list[tuple[float, Path]] = []
+        matched: list[tuple[float, Path]] = []
+        try:
+            with os.scandir(logs_dir) as it:
+                for e in it:
+                    if not e.name.endswith("_d3d11.log"):
+                        continue
+                    try:
+                        stamped_log = (e.stat().st_mtime, Path(e.path))
+                    except OSError:
+                        continue
+                    all_logs.append(stamped_log)
+                    if name_re is not None and name_re.search(e.name):
+                        matched.append(stamped_log)
+        except OSError:
+            return None
 
-        if not candidates:
+        stamped = matched or all_logs
+        if not stamped:
             return None
 
         launch_ts = self.last_game_launch_ts.get(game.appid)
         if launch_ts is not None:
-            recent = [p for p in candidates if p.exists() and p.stat().st_mtime >= (launch_ts - 5)]
+            recent = [t for t in stamped if t[0] >= (launch_ts - 5)]
             if recent:
-                recent.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                return recent[0]
+                return max(recent, key=lambda t: t[0])[1]
 
-        candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return candidates[0]
+        return max(stamped, key=lambda t: t[0])[1]
 
     def show_dxvk_log_for_selected_game(self) -> None:
         game = self.selected_game()
@@ -5268,16 +5590,14 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, APP_NAME, "No DXVK d3d11 log found for this game in ~/dxvk-logs yet. Launch the game with DXVK enabled first.")
             return
         try:
-            text = log_path.read_text(encoding="utf-8", errors="ignore")
+            lines = _tail_file(log_path)
         except Exception as exc:
             QMessageBox.warning(self, APP_NAME, f"Failed to read log: {exc}")
             return
 
-        lines = text.splitlines()
-        tail = "\n".join(lines[-200:]) if lines else "(log is empty)"
-        self.log(f"--- DXVK log: {log_path.name} (last {min(200, len(lines))} lines) ---")
-        for line in tail.splitlines():
-            self.log(line)
+        tail = "\n".join(lines) if lines else "(log is empty)"
+        self.log(f"--- DXVK log: {log_path.name} (last {len(lines)} lines) ---")
+        self.log(tail)
 
     def scan_games(self) -> None:
         p = self.prefix_path
@@ -5286,17 +5606,29 @@ class MainWindow(QMainWindow):
         if worker is not None and worker.isRunning():
             if worker.prefix == p:
                 return
+            # Let the superseded scan run out. Hold a reference until its
+            # thread finishes: dropping the last one would destroy a running
+            # QThread and abort the app.
             try:
                 worker.finished_scan.disconnect(self._on_scan_finished)
             except Exception:
                 pass
-            worker.deleteLater()
+            self._retired_scanners.add(worker)
 
         new_worker = LibraryScannerWorker(p, s)
         new_worker.finished_scan.connect(self._on_scan_finished)
+        new_worker.finished.connect(self._on_scanner_thread_finished)
         self._scanner_worker = new_worker
         new_worker.start()
 
+    def _on_scanner_thread_finished(self) -> None:
+        worker = self.sender()
+        if worker is self._scanner_worker:
+            self._scanner_worker = None
+        self._retired_scanners.discard(worker)
+        if worker is not None:
+            worker.deleteLater()
+
     def _on_scan_finished(self, prefix: Path, games: list[GameEntry]) -> None:
         if prefix != self.prefix_path:
             return
@@ -5312,37 +5644,45 @@ class MainWindow(QMainWindow):
             return
 
         self.games = games
+
+        self.games_list.setUpdatesEnabled(False)
+        self.games_container.setUpdatesEnabled(False)
         self.games_list.blockSignals(True)
-        self.games_list.clear()
+        try:
+            self.games_list.clear()
 
-        while self.games_flow_layout.count():
-            item = self.games_flow_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+            while self.games_flow_layout.count():
+                item = self.games_flow_layout.takeAt(0)
+                if item.widget():
+                    item.widget().setParent(None)
 
-        for game in games:
-            item = QListWidgetItem(game.display())
-            item.setData(256, game)
-            self.games_list.addItem(item)
-            
-            if game.appid in self._game_card_cache:
-                card = self._game_card_cache[game.appid]
-                card.setParent(self.games_container)
-            else:
-                card = self.create_game_card(game)
-                self._game_card_cache[game.appid] = card
+            for game in games:
+                item = QListWidgetItem(game.display())
+                item.setData(256, game)
+                self.games_list.addItem(item)
                 
-            self.games_flow_layout.addWidget(card)
-            card.show()
+                if game.appid in self._game_card_cache:
+                    card = self._game_card_cache[game.appid]
+                    card.setParent(self.games_container)
+                else:
+                    card = self.create_game_card(game)
+                    self._game_card_cache[game.appid] = card
+                    
+                self.games_flow_layout.addWidget(card)
+                card.show()
 
-        resolved_current = str(Path(self.prefix_combo.currentText()).expanduser().resolve())
-        resolved_default = str(Path(DEFAULT_PREFIX).expanduser().resolve())
-        is_default_bottle = resolved_current == resolved_default
+            resolved_current = str(Path(self.prefix_combo.currentText()).expanduser().resolve())
+            resolved_default = str(Path(DEFAULT_PREFIX).expanduser().resolve())
+            is_default_bottle = resolved_current == resolved_default
 
-        if games and not is_default_bottle:
-            add_card = self._create_add_game_card()
-            self.games_flow_layout.addWidget(add_card)
-            add_card.show()
+            if games and not is_default_bottle:
+                add_card = self._create_add_game_card()
+                self.games_flow_layout.addWidget(add_card)
+                add_card.show()
+        finally:
+            self.games_list.blockSignals(False)
+            self.games_container.setUpdatesEnabled(True)
+            self.games_list.setUpdatesEnabled(True)
 
         has_content = bool(games)
         self.btn_add_container.setVisible(True)
@@ -5365,7 +5705,6 @@ class MainWindow(QMainWindow):
         if manual_count:
             parts.append(f"{manual_count} custom game(s)")
         self.set_status(f"Found {', '.join(parts)}" if parts else "No games found")
-        self.games_list.blockSignals(False)
 
     def _on_steam_container_clicked(self) -> None:
         # Always switch to the default prefix — scan_games will update the view
@@ -5649,27 +5988,22 @@ class MainWindow(QMainWindow):
         if windows_no_editor.is_dir():
             target_dirs.add(windows_no_editor)
 
-        try:
-            for ship in game.game_dir.glob("**/*-Shipping.exe"):
-                if ship.is_file():
-                    target_dirs.add(ship.parent)
-        except Exception:
-            pass
-
-        try:
-            for p in game.game_dir.glob("**/Binaries/Win64"):
-                if p.is_dir():
-                    target_dirs.add(p)
-        except Exception:
-            pass
+        target_dirs |= _find_patch_dirs(game.game_dir)
 
+        dlls = list(DXVK_DLLS) + [dll for dll in DXVK_OPTIONAL_DLLS if (dxvk_bin / dll).exists()]
+        dll_data = {dll: (dxvk_bin / dll).read_bytes() for dll in dlls}
+        dll_stat = {dll: os.stat(dxvk_bin / dll) for dll in dlls}
         for tdir in sorted(target_dirs):
-            for dll in DXVK_DLLS:
-                shutil.copy2(dxvk_bin / dll, tdir / dll)
-            for dll in DXVK_OPTIONAL_DLLS:
-                if (dxvk_bin / dll).exists():
-                    shutil.copy2(dxvk_bin / dll, tdir / dll)
+            tdir_str = str(tdir)
+            for dll, data in dll_data.items():
+                dest = os.path.join(tdir_str, dll)
+                with open(dest, "wb") as f:
+                    f.write(data)
+                st = dll_stat[dll]
+                os.chmod(dest, stat.S_IMODE(st.st_mode))
+                os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
             self.log(f"Copied {', '.join(DXVK_DLLS)} -> {tdir}")
+        game.invalidate_exe_cache()
 
         self.set_status(f"Patched {game.name} with local DXVK")
 
@@ -5703,12 +6037,7 @@ class MainWindow(QMainWindow):
             return
         exe = self.selected_game_exe(game)
         if not exe:
-            try:
-                root_exes = sorted(game.game_dir.glob('*.exe'))
-                sub_exes = sorted(list(game.game_dir.glob('*/*.exe')) + list(game.game_dir.glob('*/*/*.exe')))
-                shown = [str(p.relative_to(game.game_dir)) for p in (root_exes + sub_exes)[:20]]
-            except Exception:
-                shown = []
+            shown = _sample_exes(game.game_dir)
             hint = "No EXE detected. Some games use a launcher or store the EXE in a subfolder."
             if shown:
                 hint += "\n\nEXEs found (first 20):\n" + "\n".join(shown)
@@ -5816,7 +6145,6 @@ class MainWindow(QMainWindow):
         qenv = self.get_qprocess_env()
         for key, value in env.items():
             qenv.insert(key, value)
-        self.game_process.setProcessEnvironment(qenv)
     
         exe_dir = exe.parent
         self.game_process.setWorkingDirectory(str(exe_dir))
@@ -5829,13 +6157,12 @@ class MainWindow(QMainWindow):
         if extra:
             args += shlex.split(extra)
 
+        safe_name = _SAFE_NAME_RE.sub("_", game.install_dir_name or game.name)
         if self.is_unity_game(game):
-            safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", game.install_dir_name or game.name)
             unity_log = str(Path.home() / f"{safe_name}-player.log")
             args += ["-logFile", unity_log]
             self.log(f"Unity log file will be written to: {unity_log}")
 
-        safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", game.install_dir_name or game.name)
         host_wine_log = str(Path.home() / f"{safe_name}-wine.log")
         self.log(f"Wine output will be written to: {host_wine_log}")
         self.last_game_launch_ts[game.appid] = time.time()
@@ -5844,7 +6171,8 @@ class MainWindow(QMainWindow):
         
         if effective_backend == LAUNCH_BACKEND_GPTK_FULL:
             gptk_script = "/usr/local/bin/gameportingtoolkit" if Path("/usr/local/bin/gameportingtoolkit").exists() else "gameportingtoolkit"
-            cmd = f"arch -x86_64 {shlex.quote(gptk_script)} {shlex.quote(str(prefix_model.path))} {shlex.quote(str(exe))} { ' '.join(shlex.quote(a) for a in args) } > {shlex.quote(host_wine_log)} 2>&1"
+            program = "arch"
+            program_args = ["-x86_64", gptk_script, str(prefix_model.path), str(exe), *args]
         else:
             
             backend_cmd = resolved_backend.launch_command(game_model, prefix_model)
@@ -5853,21 +6181,30 @@ class MainWindow(QMainWindow):
             if len(backend_cmd) >= 3:
                 
                 wine_binary_to_use = backend_cmd[2]
-                arch_prefix = "arch -x86_64" if backend_cmd[0] == "arch" else ""
+                use_arch = backend_cmd[0] == "arch"
             else:
                 wine_binary_to_use = self.wine_binary() or "wine"
-                arch_prefix = "arch -x86_64"
+                use_arch = True
 
-            debug_prefix = "WINEDEBUG=+loaddll"
             if self.backend_is_mesa(effective_backend):
-                debug_prefix = "WINEDEBUG=+loaddll,+wgl,+opengl"
-            
-            cmd = f"cd {shlex.quote(str(exe_dir))} && {debug_prefix} {arch_prefix} {shlex.quote(str(wine_binary_to_use))} { ' '.join(shlex.quote(a) for a in args) } > {shlex.quote(host_wine_log)} 2>&1"
+                qenv.insert("WINEDEBUG", "+loaddll,+wgl,+opengl")
+            else:
+                qenv.insert("WINEDEBUG", "+loaddll")
 
-        self.game_process.setProgram("bash")
-        self.game_process.setArguments(["-lc", cmd])
-        self.game_process.readyReadStandardOutput.connect(lambda: self._drain_process(self.game_process))
-        self.game_process.readyReadStandardError.connect(lambda: self._drain_process(self.game_process))
+            if use_arch:
+                program = "arch"
+                program_args = ["-x86_64", str(wine_binary_to_use), *args]
+            else:
+                program = str(wine_binary_to_use)
+                program_args = list(args)
+
+        # Resolve the program on the child env's PATH, not ours.
+        program = shutil.which(program, path=qenv.value("PATH") or None) or program
+        self.game_process.setProcessEnvironment(qenv)
+        self.game_process.setProgram(program)
+        self.game_process.setArguments(program_args)
+        self.game_process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self.game_process.setStandardOutputFile(host_wine_log)
         
         backend_label = "Wine builtin"
         if effective_backend == LAUNCH_BACKEND_GPTK_FULL: backend_label = "GPTK Full"
@@ -5891,12 +6228,10 @@ class MainWindow(QMainWindow):
             wine_log_path = self.last_game_wine_log.get(game.appid)
             if wine_log_path and wine_log_path.exists():
                 try:
-                    text = wine_log_path.read_text(encoding="utf-8", errors="ignore")
-                    lines = text.splitlines()
-                    tail = "\n".join(lines[-200:]) if lines else "(log is empty)"
-                    self.log(f"--- Wine log: {wine_log_path.name} (last {min(200, len(lines))} lines) ---")
-                    for line in tail.splitlines():
-                        self.log(line)
+                    lines = _tail_file(wine_log_path)
+                    tail = "\n".join(lines) if lines else "(log is empty)"
+                    self.log(f"--- Wine log: {wine_log_path.name} (last {len(lines)} lines) ---")
+                    self.log(tail)
                 except Exception as exc:
                     self.log(f"Failed to read wine log {wine_log_path}: {exc}")
 
@@ -5904,12 +6239,10 @@ class MainWindow(QMainWindow):
                 log_path = self.latest_unity_player_log_for_game(game)
                 if log_path and log_path.exists():
                     try:
-                        text = log_path.read_text(encoding="utf-8", errors="ignore")
-                        lines = text.splitlines()
-                        tail = "\n".join(lines[-200:]) if lines else "(log is empty)"
-                        self.log(f"--- Unity Player.log: {log_path} (last {min(200, len(lines))} lines) ---")
-                        for line in tail.splitlines():
-                            self.log(line)
+                        lines = _tail_file(log_path)
+                        tail = "\n".join(lines) if lines else "(log is empty)"
+                        self.log(f"--- Unity Player.log: {log_path} (last {len(lines)} lines) ---")
+                        self.log(tail)
                     except Exception as exc:
                         self.log(f"Failed to read Unity Player.log: {exc}")
 